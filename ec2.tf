@@ -1,6 +1,6 @@
 # Create ec2 instance in public subnet
 resource "aws_instance" "demo-ec2" {
-  ami           = "ami-0e9182bc6494264a4"
+  ami           = var.ec2_ami
   instance_type = "t2.medium"
   iam_instance_profile = "${aws_iam_instance_profile.demo-ec2-iam-instance-profile.name}"
   availability_zone = "ap-south-1a"
@@ -13,7 +13,6 @@ resource "aws_instance" "demo-ec2" {
   tags = {
     Name = "${var.project_prefix}-ec2-${var.env}"
   }
-  depends_on = [ aws_subnet.demo-public-subnet]
 }
 
 # Create ebs volume
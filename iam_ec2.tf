@@ -23,6 +23,12 @@ EOF
   }
 }
 
+# Attach AWS managed policy so the ec2 instance can be managed via SSM Session Manager without ssh keys
+resource "aws_iam_role_policy_attachment" "demo-ec2-ssm-policy-attachment" {
+  role       = aws_iam_role.demo-ec2-iam-role.name
+  policy_arn = "arn:aws:iam::aws:policy/AmazonSSMManagedInstanceCore"
+}
+
 # iam instance profile creation for ec2 access to S3 bucket
 resource "aws_iam_instance_profile" "demo-ec2-iam-instance-profile" {
   name = "${var.project_prefix}-ec2-iam-instance-profile-${var.env}"
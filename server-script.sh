@@ -2,13 +2,12 @@
 sudo apt-get update
 # : '
 #install nginx
-sudo apt update
 sudo apt install -y nginx
 sudo ufw allow 'Nginx HTTP'
 
 # install AWS-CLI
 sudo apt install -y unzip
-curl "https://awscli.amazonaws.com/awscli-exe-linux-x86_64.zip" -o "awscliv2.zip"
+curl -fsS --retry 5 "https://awscli.amazonaws.com/awscli-exe-linux-x86_64.zip" -o "awscliv2.zip"
 unzip awscliv2.zip
 sudo ./aws/install
 
@@ -18,18 +17,11 @@ aws s3 cp s3://demo-data4-prod/demo-prod-UI.zip demo-UI
 sudo unzip demo-UI/demo-prod-UI.zip -d /var/www/html
 
 # Install PostgreSQL DB Client
-sudo apt install -y postgresql-client-common
-sudo apt install -y postgresql-client
+sudo apt install -y postgresql-client-common postgresql-client
 
 # Install Python3 and dependencies
-sudo apt update
-sudo apt install -y software-properties-common
-sudo apt install -y python3
-sudo apt install -y python3-pip
-sudo pip3 install gekko
-sudo pip3 install pandas
-sudo pip3 install matplotlib
-sudo pip3 install Flask
+sudo apt install -y software-properties-common python3 python3-pip
+sudo pip3 install gekko pandas matplotlib Flask
 
 # Install R and dependencies
 
@@ -48,14 +40,12 @@ mkdir R_Scripts
 aws s3 cp s3://demo-data4-prod/demo_R_packages.R R_Scripts
 
 # Install R packages dependencies
-sudo apt-get update
 sudo apt-get install -y openjdk-8-jdk
 sudo R CMD javareconf
-sudo apt-get install -y libcurl4-openssl-dev libxml2-dev
-sudo apt-get install -y libglu1-mesa-dev
+sudo apt-get install -y libcurl4-openssl-dev libxml2-dev libglu1-mesa-dev
 
 # Install R packages
-sudo nohup Rscript /R_Scripts/demo_R_packages.R > nohup_r.out
+sudo nohup Rscript /R_Scripts/demo_R_packages.R > nohup_r.out &
 # '
 # Mount the EBS Volume
 sudo mkfs -t xfs /dev/xvdh
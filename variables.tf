@@ -25,6 +25,11 @@ variable "db_storage" {
 }
 
 # EC2 variables
+variable "ec2_ami" {
+  type    = string
+  default = "ami-0e9182bc6494264a4"
+}
+
 variable "ebs_storage" {
   type    = number
   default = 100
@@ -44,7 +44,6 @@ resource "aws_internet_gateway" "demo-ig" {
   tags = {
     Name = "${var.project_prefix}-ig-${var.env}"
   }
-  depends_on = [ aws_vpc.demo-vpc]
 }
 
 #DB Subnet group for posgresql
@@ -67,14 +66,12 @@ resource "aws_route_table" "demo-public-rtb" {
   tags = {
     Name = "${var.project_prefix}-public-rtb-${var.env}"
   }
-  depends_on = [ aws_internet_gateway.demo-ig]
 }
 
 #Route table for association to public subnet
 resource "aws_route_table_association" "association-public-routing-table" {
   subnet_id      = aws_subnet.demo-public-subnet.id
   route_table_id = aws_route_table.demo-public-rtb.id
-  depends_on = [aws_route_table.demo-public-rtb]
   }
 
 #Route table for private subnet
@@ -90,12 +87,20 @@ resource "aws_route_table" "demo-private-rtb" {
 resource "aws_route_table_association" "association1-private-routing-table" {
   subnet_id      = aws_subnet.demo-private-subnet1.id
   route_table_id = aws_route_table.demo-private-rtb.id
-  depends_on = [aws_route_table.demo-private-rtb]
   }
 
 #Route table for association to private subnet2
 resource "aws_route_table_association" "association2-private-routing-table" {
   subnet_id      = aws_subnet.demo-private-subnet2.id
   route_table_id = aws_route_table.demo-private-rtb.id
-  depends_on = [aws_route_table.demo-private-rtb]
   }
+
+#S3 gateway endpoint so instance traffic to the data bucket stays inside the AWS network
+resource "aws_vpc_endpoint" "demo-s3-endpoint" {
+  vpc_id          = aws_vpc.demo-vpc.id
+  service_name    = "com.amazonaws.ap-south-1.s3"
+  route_table_ids = [aws_route_table.demo-public-rtb.id, aws_route_table.demo-private-rtb.id]
+  tags = {
+    Name = "${var.project_prefix}-s3-endpoint-${var.env}"
+  }
+}